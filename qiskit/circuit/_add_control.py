@@ -13,9 +13,11 @@
 """Add control to operation if supported."""
 from __future__ import annotations
 
+from functools import cache, lru_cache
 from math import pi
 from qiskit.circuit.exceptions import CircuitError
-from qiskit.circuit.library import UnitaryGate
+from qiskit.circuit.parameterexpression import ParameterExpression
+from qiskit.circuit.library import MCPhaseGate, UnitaryGate
 from qiskit.transpiler import PassManager
 from qiskit.transpiler.passes.basis import BasisTranslator, UnrollCustomDefinitions
 from qiskit.circuit.equivalence_library import SessionEquivalenceLibrary as sel
@@ -29,7 +31,7 @@ from ._utils import _ctrl_state_to_int
 # and a controlled version of Z is MCX + two Hadamard gates.
 #
 # Note: when adding a new gate to this list, also add the decomposition of its controlled
-# version to apply_basic_controlled_gate.
+# version to _BASIC_CONTROLLED_GATE_HANDLERS.
 EFFICIENTLY_CONTROLLED_GATES = [
     "p",
     "u",
@@ -45,6 +47,12 @@ EFFICIENTLY_CONTROLLED_GATES = [
     "cx",
     "cz",
 ]
+# Set version of EFFICIENTLY_CONTROLLED_GATES for fast membership tests. The list above is
+# kept as the public form, since other modules extend it.
+_EFFICIENT_SET = frozenset(EFFICIENTLY_CONTROLLED_GATES)
+
+# Controlled phases with an absolute angle up to this value are dropped.
+_PHASE_ATOL = 1e-15
 
 
 def add_control(
@@ -126,39 +134,28 @@ def control(
     Raises:
         CircuitError: gate contains non-gate in definition
     """
-
-    # pylint: disable=cyclic-import
-    from qiskit.circuit import controlledgate
-
     ctrl_state = _ctrl_state_to_int(ctrl_state, num_ctrl_qubits)
 
     q_control = QuantumRegister(num_ctrl_qubits, name="control")
     q_target = QuantumRegister(operation.num_qubits, name="target")
     controlled_circ = QuantumCircuit(q_control, q_target, name=f"c_{operation.name}")
-    if isinstance(operation, controlledgate.ControlledGate):
+    if isinstance(operation, ControlledGate):
         original_ctrl_state = operation.ctrl_state
         operation = operation.to_mutable()
         operation.ctrl_state = None
 
     global_phase = 0
 
-    if operation.name in EFFICIENTLY_CONTROLLED_GATES:
-        apply_basic_controlled_gate(controlled_circ, operation, q_control, q_target)
+    # Resolve the control qubits once, rather than slicing the register for every gate.
+    controls = list(q_control)
+    if operation.name in _EFFICIENT_SET:
+        apply_basic_controlled_gate(controlled_circ, operation, controls, q_target)
     else:
-        if isinstance(operation, controlledgate.ControlledGate):
-            operation = operation.to_mutable()
-            operation.ctrl_state = None
-
-        unrolled_gate = _unroll_gate(operation, basis_gates=EFFICIENTLY_CONTROLLED_GATES)
-        if unrolled_gate.definition.global_phase:
-            global_phase += unrolled_gate.definition.global_phase
+        definition = _unrolled_definition(operation)
+        if definition.global_phase:
+            global_phase += definition.global_phase
 
-        definition = unrolled_gate.definition
-        bit_indices = {
-            bit: index
-            for bits in [definition.qubits, definition.clbits]
-            for index, bit in enumerate(bits)
-        }
+        bit_indices = {qubit: index for index, qubit in enumerate(definition.qubits)}
 
         for instruction in definition.data:
             gate, qargs = instruction.operation, instruction.qubits
@@ -168,7 +165,7 @@ def control(
             else:
                 target = [q_target[bit_indices[qarg]] for qarg in qargs]
 
-            apply_basic_controlled_gate(controlled_circ, gate, q_control, target)
+            apply_basic_controlled_gate(controlled_circ, gate, controls, target)
 
     # apply controlled global phase
     if global_phase:
@@ -176,7 +173,7 @@ def control(
             controlled_circ.p(global_phase, q_control)
         else:
             controlled_circ.mcp(global_phase, q_control[:-1], q_control[-1])
-    if isinstance(operation, controlledgate.ControlledGate):
+    if isinstance(operation, ControlledGate):
         operation.ctrl_state = original_ctrl_state
         new_num_ctrl_qubits = num_ctrl_qubits + operation.num_ctrl_qubits
         new_ctrl_state = operation.ctrl_state << num_ctrl_qubits | ctrl_state
@@ -195,9 +192,9 @@ def control(
     if new_num_ctrl_qubits > 2:
         ctrl_substr = f"c{new_num_ctrl_qubits:d}"
     else:
-        ctrl_substr = ("{0}" * new_num_ctrl_qubits).format("c")
+        ctrl_substr = "c" * new_num_ctrl_qubits
     new_name = f"{ctrl_substr}{base_name}"
-    cgate = controlledgate.ControlledGate(
+    cgate = ControlledGate(
         new_name,
         controlled_circ.num_qubits,
         operation.params,
@@ -217,101 +214,177 @@ def apply_basic_controlled_gate(circuit, gate, controls, target):
     ``EFFICIENTLY_CONTROLLED_GATES``.
 
     """
-    num_ctrl_qubits = len(controls)
+    handler = _BASIC_CONTROLLED_GATE_HANDLERS.get(gate.name)
+    if handler is None:
+        raise CircuitError(f"Gate {gate} not in supported basis.")
+    handler(circuit, gate, controls, target, len(controls))
 
-    if gate.name == "x":
-        circuit.mcx(controls, target)
-    elif gate.name == "rx":
-        circuit.mcrx(
-            gate.definition.data[0].operation.params[0],
-            controls,
-            target,
-            use_basis_gates=False,
-        )
-    elif gate.name == "ry":
+
+# The handlers below share a common signature, so not every handler uses every argument.
+# pylint: disable=unused-argument
+
+
+def _apply_controlled_x(circuit, gate, controls, target, num_ctrl_qubits):
+    circuit.mcx(controls, target)
+
+
+def _apply_controlled_rx(circuit, gate, controls, target, num_ctrl_qubits):
+    theta = gate.definition.data[0].operation.params[0]
+    if theta == 0:
+        return
+    circuit.mcrx(
+        theta,
+        controls,
+        target,
+        use_basis_gates=False,
+    )
+
+
+def _apply_controlled_ry(circuit, gate, controls, target, num_ctrl_qubits):
+    theta = gate.definition.data[0].operation.params[0]
+    if theta == 0:
+        return
+    circuit.mcry(
+        theta,
+        controls,
+        target,
+        mode="noancilla",
+        use_basis_gates=False,
+    )
+
+
+def _apply_controlled_rz(circuit, gate, controls, target, num_ctrl_qubits):
+    theta = gate.definition.data[0].operation.params[0]
+    if theta == 0:
+        return
+    circuit.mcrz(
+        theta,
+        controls,
+        target,
+        use_basis_gates=False,
+    )
+
+
+def _apply_controlled_p(circuit, gate, controls, target, num_ctrl_qubits):
+    circuit.append(
+        MCPhaseGate(gate.params[0], num_ctrl_qubits),
+        (*controls, target),
+    )
+
+
+def _apply_controlled_cx(circuit, gate, controls, target, num_ctrl_qubits):
+    # QuantumCircuit.mcx extends the controls with a list, so these have to stay lists.
+    circuit.mcx(
+        [*controls, target[0]],  # CX has two targets
+        target[1],
+    )
+
+
+def _apply_controlled_cz(circuit, gate, controls, target, num_ctrl_qubits):
+    circuit.h(target[1])
+    # QuantumCircuit.mcx extends the controls with a list, so these have to stay lists.
+    circuit.mcx(
+        [*controls, target[0]],  # CZ has two targets
+        target[1],
+    )
+    circuit.h(target[1])
+
+
+def _apply_controlled_u(circuit, gate, controls, target, num_ctrl_qubits):
+    theta, phi, lamb = gate.params
+    if theta == 0:
+        # U(0, phi, lamb) is the phase gate P(phi + lamb), which is the identity if the
+        # phase vanishes.
+        phase = phi + lamb
+        if _is_zero_angle(phase):
+            return
+        if num_ctrl_qubits == 1:
+            circuit.cp(phase, controls[0], target)
+        else:
+            circuit.mcp(phase, controls, target)
+    elif num_ctrl_qubits == 1:
+        circuit.cu(theta, phi, lamb, 0, controls[0], target)
+    elif phi == -pi / 2 and lamb == pi / 2:
+        circuit.mcrx(theta, controls, target, use_basis_gates=False)
+    elif phi == 0 and lamb == 0:
         circuit.mcry(
-            gate.definition.data[0].operation.params[0],
-            controls,
-            target,
-            mode="noancilla",
-            use_basis_gates=False,
-        )
-    elif gate.name == "rz":
-        circuit.mcrz(
-            gate.definition.data[0].operation.params[0],
+            theta,
             controls,
             target,
             use_basis_gates=False,
         )
-    elif gate.name == "p":
-        from qiskit.circuit.library import MCPhaseGate
-
-        circuit.append(
-            MCPhaseGate(gate.params[0], num_ctrl_qubits),
-            controls[:] + [target],
-        )
-    elif gate.name == "cx":
-        circuit.mcx(
-            controls[:] + [target[0]],  # CX has two targets
-            target[1],
-        )
-    elif gate.name == "cz":
-        circuit.h(target[1])
-        circuit.mcx(
-            controls[:] + [target[0]],  # CZ has two targets
-            target[1],
-        )
-        circuit.h(target[1])
-    elif gate.name == "u":
-        theta, phi, lamb = gate.params
-        if num_ctrl_qubits == 1:
-            if theta == 0 and phi == 0:
-                circuit.cp(lamb, controls[0], target)
-            else:
-                circuit.cu(theta, phi, lamb, 0, controls[0], target)
-        else:
-            if phi == -pi / 2 and lamb == pi / 2:
-                circuit.mcrx(theta, controls, target, use_basis_gates=False)
-            elif phi == 0 and lamb == 0:
-                circuit.mcry(
-                    theta,
-                    controls,
-                    target,
-                    use_basis_gates=False,
-                )
-            elif theta == 0 and phi == 0:
-                circuit.mcp(lamb, controls, target)
-            else:
-                circuit.mcrz(lamb, controls, target, use_basis_gates=False)
-                circuit.mcry(theta, controls, target, use_basis_gates=False)
-                circuit.mcrz(phi, controls, target, use_basis_gates=False)
-                circuit.mcp((phi + lamb) / 2, controls[1:], controls[0])
-    elif gate.name == "z":
-        circuit.h(target)
-        circuit.mcx(controls, target)
-        circuit.h(target)
-    elif gate.name == "y":
-        circuit.sdg(target)
-        circuit.mcx(controls, target)
-        circuit.s(target)
-    elif gate.name == "h":
-        circuit.s(target)
-        circuit.h(target)
-        circuit.t(target)
-        circuit.mcx(controls, target)
-        circuit.tdg(target)
-        circuit.h(target)
-        circuit.sdg(target)
-    elif gate.name == "sx":
-        circuit.h(target)
-        circuit.mcp(pi / 2, controls, target)
-        circuit.h(target)
-    elif gate.name == "sxdg":
-        circuit.h(target)
-        circuit.mcp(3 * pi / 2, controls, target)
-        circuit.h(target)
     else:
-        raise CircuitError(f"Gate {gate} not in supported basis.")
+        # Rotations by a zero angle are the identity, so skip emitting them.
+        if lamb != 0:
+            circuit.mcrz(lamb, controls, target, use_basis_gates=False)
+        circuit.mcry(theta, controls, target, use_basis_gates=False)
+        if phi != 0:
+            circuit.mcrz(phi, controls, target, use_basis_gates=False)
+        # The phase also vanishes if phi and lamb cancel up to floating point error.
+        phase = (phi + lamb) / 2
+        if not _is_zero_angle(phase):
+            circuit.mcp(phase, controls[1:], controls[0])
+
+
+def _is_zero_angle(angle):
+    """Return whether ``angle`` is a number that is zero up to floating point error."""
+    return not isinstance(angle, ParameterExpression) and abs(angle) <= _PHASE_ATOL
+
+
+def _apply_controlled_z(circuit, gate, controls, target, num_ctrl_qubits):
+    circuit.h(target)
+    circuit.mcx(controls, target)
+    circuit.h(target)
+
+
+def _apply_controlled_y(circuit, gate, controls, target, num_ctrl_qubits):
+    circuit.sdg(target)
+    circuit.mcx(controls, target)
+    circuit.s(target)
+
+
+def _apply_controlled_h(circuit, gate, controls, target, num_ctrl_qubits):
+    circuit.s(target)
+    circuit.h(target)
+    circuit.t(target)
+    circuit.mcx(controls, target)
+    circuit.tdg(target)
+    circuit.h(target)
+    circuit.sdg(target)
+
+
+def _apply_controlled_sx(circuit, gate, controls, target, num_ctrl_qubits):
+    circuit.h(target)
+    circuit.mcp(pi / 2, controls, target)
+    circuit.h(target)
+
+
+def _apply_controlled_sxdg(circuit, gate, controls, target, num_ctrl_qubits):
+    circuit.h(target)
+    circuit.mcp(3 * pi / 2, controls, target)
+    circuit.h(target)
+
+
+# Maps the name of every gate in EFFICIENTLY_CONTROLLED_GATES to the function applying its
+# multi-controlled version. Each handler takes
+# ``(circuit, gate, controls, target, num_ctrl_qubits)``.
+_BASIC_CONTROLLED_GATE_HANDLERS = {
+    "p": _apply_controlled_p,
+    "u": _apply_controlled_u,
+    "x": _apply_controlled_x,
+    "z": _apply_controlled_z,
+    "y": _apply_controlled_y,
+    "h": _apply_controlled_h,
+    "sx": _apply_controlled_sx,
+    "sxdg": _apply_controlled_sxdg,
+    "rx": _apply_controlled_rx,
+    "ry": _apply_controlled_ry,
+    "rz": _apply_controlled_rz,
+    "cx": _apply_controlled_cx,
+    "cz": _apply_controlled_cz,
+}
+
+# pylint: enable=unused-argument
 
 
 def _gate_to_circuit(operation):
@@ -325,14 +398,62 @@ def _gate_to_circuit(operation):
     return qc
 
 
-def _unroll_gate(operation, basis_gates):
-    """Unrolls a gate, possibly composite, to the target basis"""
-    circ = _gate_to_circuit(operation)
-    pm = PassManager(
+def _unrolled_definition(operation):
+    """Return the definition of ``operation`` unrolled to ``EFFICIENTLY_CONTROLLED_GATES``.
+
+    For standard gates without parameter expressions the unrolled definition only depends on
+    the gate type and its parameter values, so the result is cached. The returned circuit is
+    shared between calls and must not be mutated.
+
+    The cache is only used if the definition of ``operation`` cannot have been overridden,
+    that is if the gate is an immutable singleton or its definition was never populated.
+    """
+    standard_gate = operation._standard_gate
+    if (
+        standard_gate is not None
+        and operation.base_class is standard_gate.gate_class
+        and operation.name == standard_gate.name
+        and (not operation.mutable or operation._definition is None)
+        and not any(isinstance(param, ParameterExpression) for param in operation.params)
+    ):
+        return _cached_unrolled_definition(standard_gate, tuple(operation.params))
+    return _unroll_definition(operation)
+
+
+@lru_cache(maxsize=1024)
+def _cached_unrolled_definition(standard_gate, params):
+    """Unroll a parameter-free instance of ``standard_gate`` and cache the definition."""
+    return _unroll_definition(standard_gate.gate_class(*params))
+
+
+def _unroll_definition(operation):
+    """Return the definition of ``operation`` in terms of ``EFFICIENTLY_CONTROLLED_GATES``.
+
+    If the definition of ``operation`` only consists of such gates already, it is returned
+    as is and the unrolling passes are skipped.
+    """
+    definition = getattr(operation, "definition", None)
+    if definition is not None and all(
+        instruction.operation.name in _EFFICIENT_SET for instruction in definition.data
+    ):
+        return definition
+    return _unroll_gate(operation).definition
+
+
+@cache
+def _unroll_pass_manager():
+    """Return the pass manager used to unroll gates to ``EFFICIENTLY_CONTROLLED_GATES``.
+
+    This is built lazily on first use and then reused for every call to :func:`_unroll_gate`.
+    """
+    return PassManager(
         [
-            UnrollCustomDefinitions(sel, basis_gates=basis_gates),
-            BasisTranslator(sel, target_basis=basis_gates),
+            UnrollCustomDefinitions(sel, basis_gates=_EFFICIENT_SET),
+            BasisTranslator(sel, target_basis=_EFFICIENT_SET),
         ]
     )
-    opqc = pm.run(circ)
-    return opqc.to_gate()
+
+
+def _unroll_gate(operation):
+    """Unrolls a gate, possibly composite, to ``EFFICIENTLY_CONTROLLED_GATES``"""
+    return _unroll_pass_manager().run(_gate_to_circuit(operation)).to_gate()
@@ -12,7 +12,8 @@
 
 """U1 Gate."""
 from __future__ import annotations
-from cmath import exp
+from functools import lru_cache
+from math import cos, sin
 import numpy
 from qiskit.circuit.controlledgate import ControlledGate
 from qiskit.circuit.gate import Gate
@@ -21,6 +22,37 @@ from qiskit.circuit._utils import _ctrl_state_to_int
 from qiskit._accelerate.circuit import StandardGate
 
 
+_IDENTITY_4 = numpy.eye(4, dtype=complex)
+_IDENTITY_4.setflags(write=False)
+
+
+@lru_cache(maxsize=4096)
+def _u1_matrix(lam: float) -> numpy.ndarray:
+    """Return the read-only matrix of a U1 gate with angle ``lam``.
+
+    The result is cached and shared, so callers must copy it before handing it out.
+    """
+    mat = numpy.zeros((2, 2), dtype=complex)
+    mat[0, 0] = 1
+    mat[1, 1] = complex(cos(lam), sin(lam))
+    mat.setflags(write=False)
+    return mat
+
+
+@lru_cache(maxsize=4096)
+def _cu1_matrix(lam: float, ctrl_state: int) -> numpy.ndarray:
+    """Return the read-only matrix of a CU1 gate with angle ``lam`` and the given control state.
+
+    The result is cached and shared, so callers must copy it before handing it out.
+    """
+    mat = _IDENTITY_4.copy()
+    # The phase is applied where the target is 1 and the control matches the control state.
+    index = 3 if ctrl_state else 2
+    mat[index, index] = complex(cos(lam), sin(lam))
+    mat.setflags(write=False)
+    return mat
+
+
 class U1Gate(Gate):
     r"""Single-qubit rotation about the Z axis.
 
@@ -134,8 +166,8 @@ class U1Gate(Gate):
         if not annotated and num_ctrl_qubits == 1:
             gate = CU1Gate(self.params[0], label=label, ctrl_state=ctrl_state)
             gate.base_gate.label = self.label
-        elif not annotated and ctrl_state is None and num_ctrl_qubits > 1:
-            gate = MCU1Gate(self.params[0], num_ctrl_qubits, label=label)
+        elif not annotated and num_ctrl_qubits > 1:
+            gate = MCU1Gate(self.params[0], num_ctrl_qubits, label=label, ctrl_state=ctrl_state)
             gate.base_gate.label = self.label
         else:
             gate = super().control(
@@ -164,8 +196,10 @@ class U1Gate(Gate):
         """Return a numpy.array for the U1 gate."""
         if copy is False:
             raise ValueError("unable to avoid copy while creating an array as requested")
-        lam = float(self.params[0])
-        return numpy.array([[1, 0], [0, numpy.exp(1j * lam)]], dtype=dtype)
+        mat = _u1_matrix(float(self.params[0]))
+        if dtype is None or numpy.dtype(dtype) == numpy.complex128:
+            return mat.copy()
+        return numpy.array(mat, dtype=dtype)
 
     def __eq__(self, other):
         return isinstance(other, U1Gate) and self._compare_parameters(other)
@@ -280,8 +314,18 @@ class CU1Gate(ControlledGate):
         Returns:
             ControlledGate: controlled version of this gate.
         """
-        if not annotated and ctrl_state is None:
-            gate = MCU1Gate(self.params[0], num_ctrl_qubits=num_ctrl_qubits + 1, label=label)
+        if not annotated:
+            if ctrl_state is None:
+                ctrl_state = (1 << num_ctrl_qubits) - 1
+            else:
+                ctrl_state = _ctrl_state_to_int(ctrl_state, num_ctrl_qubits)
+            new_ctrl_state = (self.ctrl_state << num_ctrl_qubits) | ctrl_state
+            gate = MCU1Gate(
+                self.params[0],
+                num_ctrl_qubits=num_ctrl_qubits + 1,
+                label=label,
+                ctrl_state=new_ctrl_state,
+            )
             gate.base_gate.label = self.label
         else:
             gate = super().control(
@@ -311,15 +355,10 @@ class CU1Gate(ControlledGate):
         """Return a numpy.array for the CU1 gate."""
         if copy is False:
             raise ValueError("unable to avoid copy while creating an array as requested")
-        eith = exp(1j * float(self.params[0]))
-        if self.ctrl_state:
-            return numpy.array(
-                [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, eith]], dtype=dtype
-            )
-        else:
-            return numpy.array(
-                [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, eith, 0], [0, 0, 0, 1]], dtype=dtype
-            )
+        mat = _cu1_matrix(float(self.params[0]), self.ctrl_state)
+        if dtype is None or numpy.dtype(dtype) == numpy.complex128:
+            return mat.copy()
+        return numpy.array(mat, dtype=dtype)
 
     def __eq__(self, other):
         return (
@@ -392,10 +431,16 @@ class MCU1Gate(ControlledGate):
 
     def _define(self):
         # pylint: disable=cyclic-import
+        from qiskit.circuit import QuantumCircuit
+
         if self.num_ctrl_qubits == 0:
-            definition = U1Gate(self.params[0]).definition
+            definition = QuantumCircuit._from_circuit_data(
+                StandardGate.U1._get_definition(self.params), add_regs=True, name=self.name
+            )
         elif self.num_ctrl_qubits == 1:
-            definition = CU1Gate(self.params[0]).definition
+            definition = QuantumCircuit._from_circuit_data(
+                StandardGate.CU1._get_definition(self.params), add_regs=True, name=self.name
+            )
         else:
             from .p import MCPhaseGate
 
@@ -424,7 +469,10 @@ class MCU1Gate(ControlledGate):
             ControlledGate: controlled version of this gate.
         """
         if not annotated:
-            ctrl_state = _ctrl_state_to_int(ctrl_state, num_ctrl_qubits)
+            if ctrl_state is None:
+                ctrl_state = (1 << num_ctrl_qubits) - 1
+            else:
+                ctrl_state = _ctrl_state_to_int(ctrl_state, num_ctrl_qubits)
             new_ctrl_state = (self.ctrl_state << num_ctrl_qubits) | ctrl_state
             gate = MCU1Gate(
                 self.params[0],
@@ -455,7 +503,7 @@ class MCU1Gate(ControlledGate):
         Returns:
             MCU1Gate: inverse gate.
         """
-        return MCU1Gate(-self.params[0], self.num_ctrl_qubits)
+        return MCU1Gate(-self.params[0], self.num_ctrl_qubits, ctrl_state=self.ctrl_state)
 
     def __eq__(self, other):
         return (
@@ -14,6 +14,7 @@
 """Test Qiskit's controlled gate operation."""
 
 import unittest
+import unittest.mock
 
 import numpy as np
 from numpy import pi
@@ -84,6 +85,7 @@ from qiskit.circuit.library import (
     UnitaryGate,
     MCMTGate,
 )
+from qiskit.circuit._add_control import _cached_unrolled_definition, apply_basic_controlled_gate
 from qiskit.circuit._utils import _compute_control_matrix
 import qiskit.circuit.library.standard_gates as allGates
 from qiskit.synthesis.multi_controlled.multi_control_rotation_gates import _mcsu2_real_diagonal
@@ -475,6 +477,26 @@ class TestControlledGate(QiskitTestCase):
                 self.log.info(info)
                 self.assertTrue(matrix_equal(target, decomp))
 
+    def test_open_controlled_u1(self):
+        """Test open-controlled U1 and CU1 gates are built as MCU1 gates."""
+        mat_u1 = U1Gate(0.2).to_matrix()
+
+        cu1 = U1Gate(0.2).control(3, ctrl_state="010")
+        self.assertIsInstance(cu1, MCU1Gate)
+        self.assertEqual(Operator(cu1), Operator(_compute_control_matrix(mat_u1, 3, 2)))
+
+        c_cu1 = CU1Gate(0.2, ctrl_state=0).control(1)
+        self.assertIsInstance(c_cu1, MCU1Gate)
+        self.assertEqual(Operator(c_cu1), Operator(_compute_control_matrix(mat_u1, 2, 1)))
+
+        c_cu1 = CU1Gate(0.2).control(2, ctrl_state=1)
+        self.assertIsInstance(c_cu1, MCU1Gate)
+        self.assertEqual(Operator(c_cu1), Operator(_compute_control_matrix(mat_u1, 3, 5)))
+
+        for gate in [cu1, c_cu1]:
+            with self.subTest(gate=gate):
+                self.assertEqual(Operator(gate.inverse()), Operator(gate).adjoint())
+
     @data(1, 2, 3, 4)
     def test_multi_controlled_u1_matrix(self, num_controls):
         """Test the matrix representation of the multi-controlled CU1 gate.
@@ -1193,6 +1215,91 @@ class TestControlledGate(QiskitTestCase):
         with self.assertRaises(CircuitError):
             base_gate.control(num_ctrl_qubits, ctrl_state="201")
 
+    def test_repeated_control_of_standard_gate(self):
+        """Test repeatedly controlling a standard gate reuses its cached unrolled definition."""
+        # pylint cannot see through the lru_cache wrapper and flags cache_info().
+        # pylint: disable=no-value-for-parameter
+        base_gate = RXXGate(0.3)
+        target_mat = _compute_control_matrix(base_gate.to_matrix(), 2, ctrl_state=1)
+
+        _cached_unrolled_definition.cache_clear()
+        base_gate.control(2, ctrl_state=1)
+        cached = _cached_unrolled_definition(base_gate._standard_gate, (0.3,))
+        expected = cached.copy()
+        hits = _cached_unrolled_definition.cache_info().hits
+
+        second = base_gate.control(2, ctrl_state=1)
+        self.assertEqual(_cached_unrolled_definition.cache_info().hits, hits + 1)
+        self.assertEqual(cached, expected)
+        self.assertEqual(Operator(second), Operator(target_mat))
+
+        theta = Parameter("theta")
+        parameterized = RXXGate(theta).control(2, ctrl_state=1, annotated=False)
+        bound = parameterized.definition.assign_parameters({theta: 0.3})
+        self.assertEqual(Operator(bound), Operator(target_mat))
+
+    def test_control_standard_gate_with_custom_definition(self):
+        """Test controlling a standard gate honours a definition set on the instance."""
+        custom = QuantumCircuit(2)
+        custom.h(0)
+        custom.cx(0, 1)
+        base_gate = RXXGate(0.3)
+        base_gate.definition = custom
+        target_mat = _compute_control_matrix(Operator(custom).data, 1)
+
+        cgate = base_gate.control(1)
+        self.assertEqual(Operator(cgate), Operator(target_mat))
+
+    def test_control_definition_in_efficient_basis(self):
+        """Test controlling gates with a definition in the efficient basis skips unrolling."""
+        qc = QuantumCircuit(2, global_phase=0.2)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.rz(0.4, 1)
+        base_gate = qc.to_gate()
+        target_mat = _compute_control_matrix(Operator(qc).data, 2, ctrl_state=2)
+
+        theta = Parameter("theta")
+        with unittest.mock.patch("qiskit.circuit._add_control._unroll_gate") as mock_unroll:
+            cgate = base_gate.control(2, ctrl_state=2)
+            parameterized = RXXGate(theta).control(2, annotated=False)
+            mock_unroll.assert_not_called()
+
+        self.assertEqual(Operator(cgate), Operator(target_mat))
+        rxx_mat = _compute_control_matrix(RXXGate(0.3).to_matrix(), 2)
+        bound = parameterized.definition.assign_parameters({theta: 0.3})
+        self.assertEqual(Operator(bound), Operator(rxx_mat))
+
+    def test_control_skips_zero_rotations(self):
+        """Test controlling zero-angle rotations does not emit any gates for them."""
+        qc = QuantumCircuit(1)
+        qc.rx(0, 0)
+        qc.ry(0, 0)
+        qc.rz(0, 0)
+        qc.x(0)
+        base_gate = qc.to_gate()
+
+        cgate = base_gate.control(2)
+        self.assertEqual(len(cgate.definition), 1)
+        self.assertEqual(Operator(cgate), Operator(XGate().control(2)))
+
+    @data(
+        (1, [0, 0.2, 0.3], 1),
+        (3, [0, 0.2, 0.3], 1),
+        (3, [0, -pi / 2, pi / 2], 0),
+        (3, [0, 0, 0], 0),
+    )
+    @unpack
+    def test_control_u_without_theta_is_phase(self, num_ctrl_qubits, params, num_gates):
+        """Test a controlled U gate with theta = 0 is at most a single phase gate."""
+        base_gate = UGate(*params)
+        target_mat = _compute_control_matrix(base_gate.to_matrix(), num_ctrl_qubits)
+
+        qc = QuantumCircuit(num_ctrl_qubits + 1)
+        apply_basic_controlled_gate(qc, base_gate, qc.qubits[:-1], qc.qubits[-1])
+        self.assertEqual(len(qc), num_gates)
+        self.assertEqual(Operator(qc), Operator(target_mat))
+
     def test_base_gate_params_reference(self):
         """
         Test all standard gates which are of type ControlledGate and have a base gate
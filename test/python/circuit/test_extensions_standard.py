@@ -1439,6 +1439,16 @@ class TestStandardMethods(QiskitTestCase):
             self.assertTrue(matrix_equal(definition_unitary, gate_matrix))
             self.assertTrue(is_unitary_matrix(gate_matrix))
 
+    def test_u1_matrices_are_independent(self):
+        """test U1 and CU1 matrices can be modified without affecting later calls."""
+        for gate in [U1Gate(0.3), CU1Gate(0.3), CU1Gate(0.3, ctrl_state=0)]:
+            with self.subTest(gate=gate):
+                expected = Operator(gate.definition).data
+                first = gate.to_matrix()
+                first[0, 0] = 0
+                self.assertTrue(matrix_equal(gate.to_matrix(), expected))
+                self.assertTrue(matrix_equal(np.array(gate, dtype=np.complex64), expected))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)